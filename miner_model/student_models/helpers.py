@@ -5,9 +5,76 @@ These functions handle the standard 1-hour-ahead prediction pattern.
 Students can use these instead of writing the predict function from scratch.
 """
 
+import os
+import json
+import time
+import functools
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import numpy as np
 
+from ..utils.file_cache import load_cache, save_cache
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python/NumPy
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Directories that never contain model or data files - always skipped by find_files()
+SKIPPED_DIRS = {'__pycache__', '.ipynb_checkpoints'}
+
+
+def find_files(directory, extensions, exclude_dirs=(), cache_path=None):
+    """
+    Find all files with the given extensions in directory and its subdirectories.
+    
+    The directory tree is scanned only once for all extensions. If cache_path is
+    given, the result is saved there and reused on later runs until a file is
+    added, removed or renamed in one of the scanned directories.
+    
+    Args:
+        directory: Directory to search
+        extensions: File extensions to look for (e.g., ['.h5', '.csv'])
+        exclude_dirs: Names of subdirectories to skip (in addition to SKIPPED_DIRS)
+        cache_path: Optional path to a JSON file for caching the result
+    
+    Returns:
+        Dict mapping each extension to a list of file paths (in the order found)
+    
+    Example:
+        found = find_files('miner_model', ['.h5', '.csv'], exclude_dirs=['LSTM_outside_example'])
+        model_files = found['.h5']
+    """
+    if cache_path is not None:
+        found = load_cache(cache_path)
+        if isinstance(found, dict) and all(ext in found for ext in extensions):
+            return found
+    
+    skipped = SKIPPED_DIRS.union(exclude_dirs)
+    found = {ext: [] for ext in extensions}
+    scanned_dirs = []
+    for root, dirs, files in os.walk(directory):
+        # Skip excluded directories (removing them from dirs stops os.walk
+        # from descending into them at all)
+        dirs[:] = [d for d in dirs if d not in skipped]
+        scanned_dirs.append(root)
+        for file in files:
+            for ext in extensions:
+                if file.endswith(ext):
+                    found[ext].append(os.path.join(root, file))
+                    break
+    
+    if cache_path is not None:
+        save_cache(cache_path, found, scanned_dirs)
+    
+    return found
+
 
 def get_recent_prices(data, timestamp, n_steps=12):
     """
@@ -40,6 +107,109 @@ def get_recent_prices(data, timestamp, n_steps=12):
     return recent_prices.reshape(1, n_steps, 1)
 
 
+def dataframe_to_arrays(data):
+    """
+    Convert a prepared DataFrame into NumPy arrays for fast lookups.
+    
+    Selecting rows from a DataFrame on every prediction is slow. This converts
+    the data once into a contiguous float32 array of prices and a sorted int64
+    array of timestamps (nanoseconds), which get_recent_window() can search directly.
+    
+    Args:
+        data: DataFrame with datetime index and 'close_price' column
+              (as returned by prepare_dataframe)
+    
+    Returns:
+        Tuple of (values, index):
+        - values: float32 array of shape (n_rows, 1)
+        - index: int64 array of shape (n_rows,) with timestamps in nanoseconds
+    
+    Example:
+        values, index = dataframe_to_arrays(data)
+    """
+    values = np.ascontiguousarray(data[['close_price']].to_numpy(dtype=np.float32))
+    index = data.index.values.astype('datetime64[ns]').view('int64')
+    return values, index
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def timestamp_to_ns(timestamp):
+    """
+    Convert an ISO format timestamp to nanoseconds since 1970-01-01 (int).
+    
+    Gives the same numbers as the index from dataframe_to_arrays(): timestamps
+    with a UTC offset are converted to UTC, timestamps without one are used as is.
+    
+    Args:
+        timestamp: ISO format timestamp string (e.g., "2024-01-15T10:30:00+00:00")
+    
+    Returns:
+        Nanoseconds since the epoch
+    
+    Example:
+        timestamp_to_ns("1970-01-01T00:00:01+00:00")  # Returns: 1000000000
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        # Formats datetime.fromisoformat() doesn't support (e.g. "Z" suffix on older Python)
+        return pd.Timestamp(timestamp).value
+    
+    epoch = _EPOCH if dt.tzinfo is None else _EPOCH_UTC
+    return (dt - epoch) // timedelta(microseconds=1) * 1000
+
+
+def get_recent_window(values, index, timestamp, n_steps=12):
+    """
+    Get the last n_steps prices before the given timestamp from NumPy arrays.
+    
+    Same result as get_recent_prices(), but works on the arrays returned by
+    dataframe_to_arrays() and returns a view instead of copying the data.
+    
+    Args:
+        values: float32 array of shape (n_rows, n_features)
+        index: Sorted int64 array of timestamps in nanoseconds
+        timestamp: ISO format timestamp string (e.g., "2024-01-15T10:30:00+00:00")
+        n_steps: Number of timesteps to retrieve (default: 12 = 1 hour for 5-min data)
+    
+    Returns:
+        Array of shape (1, n_steps, n_features) ready for model input, or None if insufficient data
+    
+    Example:
+        values, index = dataframe_to_arrays(data)
+        X = get_recent_window(values, index, "2024-01-15T10:30:00+00:00", n_steps=12)
+    """
+    return _window_before(values, index, timestamp_to_ns(timestamp), n_steps)
+
+
+def _window_before(values, index, target_time, n_steps):
+    """
+    get_recent_window() for a target time already in nanoseconds.
+    """
+    window = _recent_window(values, index, target_time, n_steps)
+    
+    if window.shape[0] < n_steps:
+        return None
+    
+    return window[None, ...]
+
+
+@njit(cache=True)
+def _recent_window(values, index, target_time, n_steps):
+    """
+    Rows of values for the n_steps timestamps before target_time (compiled with numba if available).
+    
+    Returns an empty array if there are fewer than n_steps earlier rows.
+    """
+    i = np.searchsorted(index, target_time)
+    if i < n_steps:
+        return values[:0]
+    return values[i - n_steps:i]
+
+
 def calculate_interval(prediction, method='fixed', std_error=None, percentage=0.01):
     """
     Calculate 90% confidence interval for a prediction.
@@ -78,6 +248,37 @@ def calculate_interval(prediction, method='fixed', std_error=None, percentage=0.
     return [lower, upper]
 
 
+def read_csv(path):
+    """
+    Read a CSV file into a DataFrame.
+    
+    Uses PyArrow's multi-threaded CSV parser if it is installed (much faster
+    for large files), otherwise pandas.read_csv().
+    
+    Args:
+        path: Path to the .csv file
+    
+    Returns:
+        DataFrame with the file contents
+    
+    Example:
+        df = read_csv('data.csv')
+        data = prepare_dataframe(df)
+    """
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(path)
+    
+    try:
+        table = pacsv.read_csv(path, read_options=pacsv.ReadOptions(use_threads=True))
+    except Exception:
+        # Fall back to pandas for files PyArrow can't parse
+        return pd.read_csv(path)
+    
+    return table.to_pandas()
+
+
 def prepare_dataframe(df, time_col=None, price_col=None):
     """
     Prepare a DataFrame for time series prediction.
@@ -127,7 +328,429 @@ def prepare_dataframe(df, time_col=None, price_col=None):
     return time_series_df
 
 
-def predict_1hour_ahead(model, data, timestamp, n_steps=12, interval_method='fixed', interval_std=None):
+def load_keras_model(model_path, cache_path=None, custom_objects=None):
+    """
+    Load a Keras .h5 model, reusing its cached architecture on later runs.
+    
+    Rebuilding the model from the architecture stored in the .h5 file is a large
+    part of the load time. If cache_path is given, the architecture is saved
+    there after the first load; later runs build the model from it and only
+    read the weights from the .h5 file. The cache is ignored when the .h5 file
+    changes (same check as the TFLite conversion, see _source_key()).
+    
+    Args:
+        model_path: Path to the .h5 model file
+        cache_path: Optional path to a .json file for caching the architecture
+        custom_objects: Optional dict of custom layers/functions used by the model
+    
+    Returns:
+        Keras model (not compiled)
+    
+    Example:
+        model = load_keras_model('my_model.h5', cache_path='_arch_cache.json')
+    """
+    from tensorflow.keras.models import load_model, model_from_json
+    
+    if cache_path is None:
+        return load_model(model_path, compile=False, custom_objects=custom_objects)
+    
+    cache_key = _source_key(model_path)
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached['key'] == cache_key:
+            model = model_from_json(cached['architecture'], custom_objects=custom_objects)
+            model.load_weights(model_path)
+            return model
+    except Exception:
+        pass  # No cache yet, or it doesn't match - load the full model below
+    
+    model = load_model(model_path, compile=False, custom_objects=custom_objects)
+    
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({'key': cache_key, 'architecture': model.to_json()}, f)
+    except OSError:
+        pass
+    
+    return model
+
+
+def configure_tensorflow(intra_op_threads=None, inter_op_threads=2, jit=True):
+    """
+    Configure the TensorFlow runtime for low-latency predictions.
+    
+    Must be called before the model is loaded - TensorFlow's thread pools can't
+    be changed once they are in use (the call then only sets jit).
+    
+    Args:
+        intra_op_threads: Threads used inside a single operation (default: all CPU cores)
+        inter_op_threads: Operations that may run in parallel (default: 2)
+        jit: Let TensorFlow compile graphs with XLA where possible (default: True)
+    """
+    import tensorflow as tf
+    
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads or os.cpu_count())
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except RuntimeError:
+        pass  # TensorFlow is already initialized
+    
+    tf.config.optimizer.set_jit(jit)
+
+
+class CompiledModel:
+    """
+    Runs a Keras model through a pre-traced XLA graph.
+    
+    model.predict() has a large fixed cost per call. Because the miner always
+    predicts on the same input shape (1, n_steps, n_features), the forward pass
+    is traced once for that shape and compiled with XLA. The first call (which
+    pays the compile cost) is made here, so real predictions are fast.
+    
+    Args:
+        model: Keras model
+        n_steps: Number of timesteps in the model input (default: 12)
+    
+    Example:
+        fast_model = CompiledModel(model, n_steps=12)
+        prediction = fast_model.predict(X)[0, 0]
+    """
+    
+    def __init__(self, model, n_steps=12):
+        import tensorflow as tf
+        
+        self._tf = tf
+        self.model = model
+        self.input_shape = (1, n_steps, model.input_shape[-1])
+        self._infer = tf.function(
+            lambda x: model(x, training=False),
+            jit_compile=True
+        ).get_concrete_function(tf.TensorSpec(shape=self.input_shape, dtype=tf.float32))
+        
+        # Warm up: compile the graph now instead of on the first real prediction
+        self.predict(np.zeros(self.input_shape, dtype=np.float32))
+    
+    def predict(self, X, verbose=0):
+        """
+        Same as model.predict(X) for a single input window.
+        """
+        x = self._tf.convert_to_tensor(X, dtype=self._tf.float32)
+        return self._infer(x).numpy()
+
+
+def compile_model(model, n_steps=12):
+    """
+    Wrap a Keras model in a CompiledModel, falling back to the model itself.
+    
+    Not every model can be compiled with XLA. In that case the original model
+    is returned, so predictions still work (just slower).
+    
+    Args:
+        model: Keras model
+        n_steps: Number of timesteps in the model input (default: 12)
+    
+    Returns:
+        Object with a .predict() method
+    """
+    try:
+        return CompiledModel(model, n_steps=n_steps)
+    except Exception:
+        return model
+
+
+class TFLiteModel:
+    """
+    Runs a converted TensorFlow Lite model with a Keras-like .predict() method.
+    
+    Args:
+        model_content: TFLite flatbuffer (bytes), e.g. from quantize_model()
+        num_threads: Number of CPU threads for the interpreter (default: all cores)
+    
+    Example:
+        fast_model = TFLiteModel(tflite_bytes)
+        prediction = fast_model.predict(X)[0, 0]
+    """
+    
+    def __init__(self, model_content, num_threads=None):
+        import tensorflow as tf
+        
+        self._interpreter = tf.lite.Interpreter(
+            model_content=model_content,
+            num_threads=num_threads or os.cpu_count()
+        )
+        self._interpreter.allocate_tensors()
+        input_details = self._interpreter.get_input_details()[0]
+        self._input_index = input_details['index']
+        self._output_index = self._interpreter.get_output_details()[0]['index']
+        self.input_shape = tuple(int(d) for d in input_details['shape'])
+    
+    def predict(self, X, verbose=0):
+        """
+        Same as model.predict(X) for a single input window.
+        """
+        self._interpreter.set_tensor(self._input_index, np.asarray(X, dtype=np.float32))
+        self._interpreter.invoke()
+        return self._interpreter.get_tensor(self._output_index)
+
+
+def _tflite_paths(model_path):
+    """
+    Paths of the converted model and of the file recording which .h5 file it
+    was made from (and whether the conversion was usable).
+    """
+    base = os.path.splitext(model_path)[0]
+    return base + '.tflite', base + '.tflite.json'
+
+
+def _source_key(model_path):
+    """
+    Identify the exact version of the .h5 file (modification time and size).
+    """
+    stat = os.stat(model_path)
+    return {'h5_mtime_ns': stat.st_mtime_ns, 'h5_size': stat.st_size}
+
+
+def _conversion_result(model_path):
+    """
+    Result of the last conversion of this exact .h5 file: True (usable),
+    False (failed or rejected), or None if it wasn't converted yet.
+    """
+    _, key_path = _tflite_paths(model_path)
+    try:
+        with open(key_path, 'r') as f:
+            record = json.load(f)
+        if record['source'] != _source_key(model_path):
+            return None
+        return bool(record['converted'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_conversion_result(model_path, converted):
+    """
+    Record whether converting this exact .h5 file worked (see _conversion_result()).
+    """
+    _, key_path = _tflite_paths(model_path)
+    with open(key_path, 'w') as f:
+        json.dump({'source': _source_key(model_path), 'converted': converted}, f)
+
+
+def load_quantized_model(model_path):
+    """
+    Load the TFLite model saved by quantize_model() for model_path.
+    
+    The saved model is only used if the .h5 file has exactly the same
+    modification time and size as when it was converted, so the Keras model
+    doesn't have to be loaded at all.
+    
+    Args:
+        model_path: Path to the .h5 model file
+    
+    Returns:
+        TFLiteModel instance, or None if there is no up-to-date converted model
+    
+    Example:
+        fast_model = load_quantized_model('my_model.h5')
+    """
+    if not _conversion_result(model_path):
+        return None
+    
+    tflite_path, _ = _tflite_paths(model_path)
+    try:
+        with open(tflite_path, 'rb') as f:
+            return TFLiteModel(f.read())
+    except Exception:
+        return None  # Corrupt or unreadable file
+
+
+def quantize_model(model, model_path, sample, tolerance=1e-3):
+    """
+    Convert a Keras model to a float16-quantized TFLite model.
+    
+    The converted model must give the same prediction as the Keras model on
+    sample (within tolerance), otherwise it isn't used. If it passes, it is
+    saved next to the .h5 file (same name, .tflite extension) for
+    load_quantized_model(). If it fails, that is recorded too, and this
+    .h5 file isn't converted again on later runs.
+    
+    Args:
+        model: Keras model loaded from model_path
+        model_path: Path to the .h5 model file
+        sample: Real model input of shape (1, n_steps, n_features) to compare predictions on
+        tolerance: Maximum relative difference between the two predictions (default: 0.1%)
+    
+    Returns:
+        TFLiteModel instance, or None if the model could not be converted
+        or its predictions differ too much
+    
+    Example:
+        fast_model = quantize_model(model, 'my_model.h5', values[-12:][None, ...])
+    """
+    if sample is None or _conversion_result(model_path) is False:
+        return None
+    
+    try:
+        import tensorflow as tf
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+        model_content = converter.convert()
+        tflite_model = TFLiteModel(model_content)
+        
+        expected = np.asarray(model.predict(sample, verbose=0))
+        actual = tflite_model.predict(sample)
+        if not np.allclose(actual, expected, rtol=tolerance, atol=1e-6):
+            raise ValueError("converted model predicts differently")
+    except Exception:
+        try:
+            _save_conversion_result(model_path, False)
+        except OSError:
+            pass
+        return None
+    
+    tflite_path, key_path = _tflite_paths(model_path)
+    try:
+        # Write the record last, so a partly written model is never reused
+        if os.path.exists(key_path):
+            os.remove(key_path)
+        with open(tflite_path, 'wb') as f:
+            f.write(model_content)
+        _save_conversion_result(model_path, True)
+    except OSError:
+        pass
+    
+    return tflite_model
+
+
+def load_fast_model(model_path, load_model_func, values, n_steps=12):
+    """
+    Load a model in the fastest form that still predicts like the original.
+    
+    1. The TFLite model converted on an earlier run, if the .h5 file hasn't
+       changed (then the Keras model isn't loaded at all)
+    2. A new float16 TFLite conversion, if it predicts the same as the Keras
+       model on the latest window of values
+    3. The Keras model compiled for (1, n_steps, n_features) inputs
+       (which in turn falls back to the plain Keras model)
+    
+    Args:
+        model_path: Path to the .h5 model file
+        load_model_func: Function that loads the Keras model from model_path
+        values: Price array from dataframe_to_arrays()
+        n_steps: Number of timesteps in the model input (default: 12)
+    
+    Returns:
+        Object with a .predict() method
+    
+    Example:
+        fast_model = load_fast_model('my_model.h5', load_keras_model, values)
+    """
+    fast_model = load_quantized_model(model_path)
+    if fast_model is not None:
+        return fast_model
+    
+    model = load_model_func(model_path)
+    sample = values[-n_steps:][None, ...] if len(values) >= n_steps else None
+    fast_model = quantize_model(model, model_path, sample)
+    if fast_model is None:
+        fast_model = compile_model(model, n_steps=n_steps)
+    return fast_model
+
+
+class LazyModel:
+    """
+    Loads a model (and its data) once, the first time it is needed.
+    
+    Thread-safe: if several threads ask at once, only one of them loads.
+    If loading fails, later calls raise a RuntimeError (caused by the original
+    error) without loading again, until retry_after seconds have passed. Then
+    the next call tries again, so temporary problems (e.g. a file still being
+    copied) don't need a restart.
+    
+    Args:
+        load_func: Function that loads everything and returns it
+        retry_after: Seconds to wait after a failed load before trying again (default: 60)
+    
+    Example:
+        loaded = LazyModel(load_everything)
+        fast_model, data = loaded.get()
+    """
+    
+    def __init__(self, load_func, retry_after=60):
+        self._load_func = load_func
+        self._retry_after = retry_after
+        self._value = None
+        self._loaded = False
+        self._error = None
+        self._failed_at = None
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """
+        Return what load_func returned, calling it first if needed.
+        """
+        if self._loaded:
+            return self._value
+        
+        with self._lock:
+            if self._loaded:
+                return self._value
+            if self._error is not None and time.monotonic() - self._failed_at < self._retry_after:
+                # Raise a new exception each time - re-raising the stored one
+                # would keep growing its traceback
+                raise RuntimeError(f"Model failed to load: {self._error}") from self._error
+            try:
+                self._value = self._load_func()
+            except Exception as e:
+                self._error = e
+                self._failed_at = time.monotonic()
+                raise
+            self._loaded = True
+            self._error = None
+            return self._value
+
+
+def warm_up(model, n_steps=12, values=None, index=None):
+    """
+    Run one prediction on dummy data so the first real prediction is fast.
+    
+    The first prediction after loading a model is much slower than the rest
+    (graphs are built, kernels are selected, memory is allocated). Calling
+    this right after loading moves that cost out of the first request.
+    
+    If the data arrays are given, the window lookup of get_recent_window()
+    is warmed up too (numba compiles it on first use), and the latest real
+    window is used instead of zeros.
+    
+    Args:
+        model: Model with a .predict() method and an input_shape attribute
+               (Keras model, CompiledModel or TFLiteModel)
+        n_steps: Number of timesteps to use where the input shape doesn't fix it
+        values: Optional price array from dataframe_to_arrays()
+        index: Optional timestamp array from dataframe_to_arrays()
+    
+    Returns:
+        True if the dummy prediction succeeded, False otherwise
+    """
+    try:
+        X = None
+        if values is not None and index is not None and len(index) > 0:
+            # Window for a time just after the last row (like a live request)
+            X = _window_before(values, index, int(index[-1]) + 1, n_steps)
+        if X is None:
+            shape = tuple(model.input_shape)
+            shape = (1,) + tuple(n_steps if d is None else d for d in shape[1:])
+            X = np.zeros(shape, dtype=np.float32)
+        model.predict(X, verbose=0)
+        return True
+    except Exception:
+        return False
+
+
+def predict_1hour_ahead(model, data, timestamp, n_steps=12, interval_method='fixed', interval_std=None,
+                        values=None, index=None):
     """
     Standard 1-hour-ahead prediction function.
     
@@ -141,6 +764,8 @@ def predict_1hour_ahead(model, data, timestamp, n_steps=12, interval_method='fix
         n_steps: Number of timesteps to use (default: 12 = 1 hour for 5-min data)
         interval_method: 'fixed' or 'std' for confidence interval calculation
         interval_std: Standard error for 'std' method
+        values: Optional price array from dataframe_to_arrays() (faster than using data)
+        index: Optional timestamp array from dataframe_to_arrays()
     
     Returns:
         Tuple of (prediction, interval) or (None, None) if prediction fails
@@ -154,7 +779,10 @@ def predict_1hour_ahead(model, data, timestamp, n_steps=12, interval_method='fix
         )
     """
     # Get recent prices
-    X = get_recent_prices(data, timestamp, n_steps=n_steps)
+    if values is not None and index is not None:
+        X = get_recent_window(values, index, timestamp, n_steps=n_steps)
+    else:
+        X = get_recent_prices(data, timestamp, n_steps=n_steps)
     
     if X is None:
         return None, None
@@ -175,3 +803,61 @@ def predict_1hour_ahead(model, data, timestamp, n_steps=12, interval_method='fix
     
     return prediction, interval
 
+
+
+def cache_predictions(index, maxsize=256):
+    """
+    Decorator that caches predict(timestamp) results.
+    
+    Validators often ask for the same (or nearly the same) timestamp several
+    times. A prediction only depends on which rows of the data come before the
+    timestamp, so timestamps with the same rows before them share one cached
+    result instead of running the model again.
+    
+    Args:
+        index: Sorted int64 timestamp array from dataframe_to_arrays(), or a
+               function returning it (if the data is loaded later)
+        maxsize: Maximum number of cached predictions (least recently used are dropped)
+    
+    Returns:
+        Decorator for a predict(timestamp) function. The decorated function has a
+        cache_clear() method - call it if you reload the data.
+    
+    Example:
+        @cache_predictions(index)
+        def predict(timestamp):
+            return predict_1hour_ahead(...)
+    """
+    def decorator(predict_func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(predict_func)
+        def predict(timestamp):
+            sorted_index = index() if callable(index) else index
+            key = int(np.searchsorted(sorted_index, timestamp_to_ns(timestamp)))
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    prediction, interval = cache[key]
+                    return prediction, list(interval) if interval is not None else None
+            
+            prediction, interval = predict_func(timestamp)
+            
+            # Don't cache failures - they may not happen next time
+            if prediction is not None:
+                with lock:
+                    cache[key] = (prediction, list(interval) if interval is not None else None)
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            
+            return prediction, interval
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+        
+        predict.cache_clear = cache_clear
+        return predict
+    
+    return decorator
@@ -7,12 +7,21 @@ The predict function is already provided - it uses the standard 1-hour-ahead pat
 """
 
 import os
-import glob
-import pandas as pd
-from tensorflow.keras.models import load_model
 
 # Import helper functions (they handle the standard prediction pattern)
-from .helpers import predict_1hour_ahead, prepare_dataframe
+from .helpers import (
+    configure_tensorflow,
+    find_files,
+    load_keras_model,
+    predict_1hour_ahead,
+    prepare_dataframe,
+    read_csv,
+    dataframe_to_arrays,
+    load_fast_model,
+    LazyModel,
+    warm_up,
+    cache_predictions,
+)
 
 # ============================================
 # SECTION 1: Load Your Model
@@ -25,15 +34,17 @@ from .helpers import predict_1hour_ahead, prepare_dataframe
 current_dir = os.path.dirname(os.path.abspath(__file__))
 miner_model_dir = os.path.dirname(current_dir)
 
-# Search for .h5 files in miner_model directory, excluding LSTM_outside_example
-model_files = []
-for root, dirs, files in os.walk(miner_model_dir):
-    # Skip LSTM_outside_example directory
-    if 'LSTM_outside_example' in root:
-        continue
-    for file in files:
-        if file.endswith('.h5'):
-            model_files.append(os.path.join(root, file))
+# Search for .h5 and .csv files in miner_model directory, excluding LSTM_outside_example.
+# The result is cached in _discovery_cache.json and only searched again
+# when files are added, removed or renamed.
+found_files = find_files(
+    miner_model_dir,
+    ['.h5', '.csv'],
+    exclude_dirs=['LSTM_outside_example'],
+    cache_path=os.path.join(miner_model_dir, '_discovery_cache.json')
+)
+model_files = found_files['.h5']
+csv_files = found_files['.csv']
 
 if not model_files:
     raise FileNotFoundError(
@@ -45,9 +56,20 @@ if not model_files:
 # Use the first .h5 file found (you can change this to select a specific file)
 model_path = model_files[0]
 
-# Load the model
-# You can customize this if needed (e.g., change compile=False, add custom_objects, etc.)
-model = load_model(model_path, compile=False)
+
+def _load_model(path):
+    """
+    Load the Keras model from path.
+
+    The model architecture is also cached in _arch_cache.json, so later runs
+    only need to read the weights from the .h5 file.
+    You can customize this if needed (e.g., add custom_objects)
+    """
+    return load_keras_model(
+        path,
+        cache_path=os.path.join(miner_model_dir, '_arch_cache.json'),
+        custom_objects=None
+    )
 
 
 # ============================================
@@ -57,16 +79,6 @@ model = load_model(model_path, compile=False)
 # (excluding LSTM_outside_example).
 # You can change the data_path if your data is in a different location.
 
-# Search for .csv files in miner_model directory, excluding LSTM_outside_example
-csv_files = []
-for root, dirs, files in os.walk(miner_model_dir):
-    # Skip LSTM_outside_example directory
-    if 'LSTM_outside_example' in root:
-        continue
-    for file in files:
-        if file.endswith('.csv'):
-            csv_files.append(os.path.join(root, file))
-
 if not csv_files:
     raise FileNotFoundError(
         f"No .csv data files found in {miner_model_dir}.\n"
@@ -77,9 +89,45 @@ if not csv_files:
 # Use the first .csv file found (you can change this to select a specific file)
 data_path = csv_files[0]
 
-# Load and prepare data using helper function
-df = pd.read_csv(data_path)
-data = prepare_dataframe(df)  # Helper handles all the formatting!
+
+def _load():
+    """
+    Load the model and data (called once, the first time they are needed).
+    """
+    # Configure TensorFlow before the model is loaded
+    # (use all CPU cores and XLA compilation for faster predictions)
+    configure_tensorflow()
+    
+    # Load and prepare data using helper function
+    df = read_csv(data_path)
+    data = prepare_dataframe(df)  # Helper handles all the formatting!
+    
+    # Keep a NumPy copy of the data for fast lookups in predict()
+    values, index = dataframe_to_arrays(data)
+    
+    # Load the model in its fastest form (a converted TFLite model if possible)
+    fast_model = load_fast_model(model_path, _load_model, values, n_steps=12)
+    
+    # Make one prediction on the latest data now, so the first real prediction is fast
+    warm_up(fast_model, n_steps=12, values=values, index=index)
+    
+    return fast_model, data, values, index
+
+
+# The model and data are loaded when the miner starts (see initialize()),
+# not when this file is imported, so importing it doesn't wait for TensorFlow.
+# If loading fails, it is tried again on a prediction a minute later.
+loaded = LazyModel(_load)
+
+
+def initialize():
+    """
+    Load the model and data. Called by the miner when it starts.
+    
+    If loading fails, the error is logged and the miner reports it.
+    """
+    loaded.get()
+    return True
 
 
 # ============================================
@@ -88,6 +136,9 @@ data = prepare_dataframe(df)  # Helper handles all the formatting!
 # The predict function uses the standard helper function.
 # You can customize the parameters if needed.
 
+# Predictions are cached: repeated requests for the same data window reuse the
+# previous result. Call predict.cache_clear() if you reload the data.
+@cache_predictions(lambda: loaded.get()[3], maxsize=256)
 def predict(timestamp):
     """
     Predict USDT/CNY price 1 hour ahead.
@@ -95,11 +146,14 @@ def predict(timestamp):
     Uses the standard prediction pattern via helper function.
     You can customize the parameters below if needed.
     """
+    fast_model, data, values, index = loaded.get()
     return predict_1hour_ahead(
-        model=model,
+        model=fast_model,
         data=data,
         timestamp=timestamp,
         n_steps=12,  # 12 timesteps = 1 hour (for 5-minute data)
         interval_method='fixed',  # Change to 'std' if you have standard error
-        interval_std=None  # Set your std_error here if using 'std' method
+        interval_std=None,  # Set your std_error here if using 'std' method
+        values=values,
+        index=index
     )
@@ -0,0 +1,75 @@
+"""
+File Discovery Cache
+
+Remembers the result of a directory scan in a small JSON file, so the scan
+doesn't have to be repeated on every start. The cached result is only used
+while none of the scanned directories have changed.
+
+Like the other caches next to the model (architecture, TFLite conversion),
+it is only a speed-up: if it can't be written, e.g. because the directory is
+read-only, the miner still works and simply scans again on the next start.
+"""
+
+import os
+import json
+from typing import Any, Iterable, Optional
+
+
+def _mtimes(paths: Iterable[str]) -> dict:
+    """
+    Get the modification time (in nanoseconds) of each path, or None if missing.
+    """
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def load_cache(cache_path: str) -> Optional[Any]:
+    """
+    Load a cached scan result.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+    
+    Returns:
+        The cached value, or None if there is no cache or any of the
+        directories it depends on changed since it was saved
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            entry = json.load(f)
+        value = entry['value']
+        mtimes = entry['mtimes']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if _mtimes(mtimes) != mtimes:
+        return None
+    
+    return value
+
+
+def save_cache(cache_path: str, value: Any, paths: Iterable[str]) -> None:
+    """
+    Save a scan result, valid until any of the given paths changes.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        value: JSON-serializable scan result
+        paths: Directories the result depends on (usually every scanned directory)
+    """
+    try:
+        # Create the file before reading the mtimes: creating a file changes
+        # the mtime of its directory, which would invalidate the cache right away
+        if not os.path.exists(cache_path):
+            open(cache_path, 'a').close()
+        
+        entry = {'value': value, 'mtimes': _mtimes(paths)}
+        with open(cache_path, 'w') as f:
+            json.dump(entry, f)
+    except OSError:
+        pass
@@ -15,6 +15,10 @@ class FunctionBasedModel(PredictionModel):
     
     This allows students to write just a function instead of a full class.
     
+    model.predict is the wrapped function itself (no extra call in between).
+    Exceptions raised by it propagate to the caller - Miner.forward() catches
+    and logs them.
+    
     Example:
         def my_predict(timestamp):
             return 7.25, [7.10, 7.40]
@@ -22,38 +26,53 @@ class FunctionBasedModel(PredictionModel):
         model = FunctionBasedModel(my_predict)
     """
     
-    def __init__(self, predict_func):
+    def __init__(self, predict_func, initialize_func=None):
         """
         Initialize with a predict function.
         
         Args:
             predict_func: Function that takes timestamp (str) and returns
                          (prediction: float, interval: [lower, upper])
+            initialize_func: Optional function called when the miner starts
+                            (e.g. to load the model); returns bool
         """
         self.predict_func = predict_func
+        self.initialize_func = initialize_func
+        
+        # Bind the function directly, so model.predict(timestamp) calls it
+        # without going through a method (see class docstring)
+        self.predict = predict_func
     
     def predict(self, timestamp: str) -> Tuple[Optional[float], Optional[List[float]]]:
         """
         Call the wrapped predict function.
         
+        Instances use the wrapped function directly (see __init__), so this
+        is only reached when called on the class, e.g. FunctionBasedModel.predict(model, ts).
+        
         Args:
             timestamp: ISO format timestamp string
         
         Returns:
             Tuple of (prediction, interval) from the wrapped function
         """
-        try:
-            return self.predict_func(timestamp)
-        except Exception as e:
-            import bittensor as bt
-            bt.logging.error(f"Error in predict function: {e}")
-            return None, None
+        return self.predict_func(timestamp)
     
     def initialize(self) -> bool:
         """
-        Always returns True - function is already callable.
+        Call the wrapped initialize function, if there is one.
+        
+        Returns:
+            Result of the initialize function, or True if there is none
         """
-        return True
+        if self.initialize_func is None:
+            return True
+        try:
+            return bool(self.initialize_func())
+        except Exception as e:
+            import bittensor as bt
+            bt.logging.error(f"Error in initialize function: {e}")
+            return False
     
     def cleanup(self) -> None:
         """
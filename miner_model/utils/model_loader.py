@@ -5,12 +5,14 @@ Automatically finds and loads student models from the student_models/ folder.
 """
 
 import os
+import sys
 import importlib
 import importlib.util
 import bittensor as bt
 from typing import Optional
 from ..model_interface import PredictionModel
 from .function_wrapper import FunctionBasedModel
+from .file_cache import load_cache, save_cache
 
 
 def load_student_model() -> Optional[PredictionModel]:
@@ -18,7 +20,8 @@ def load_student_model() -> Optional[PredictionModel]:
     Auto-discover and load student model from student_models/ folder.
     
     Looks for .py files (excluding helpers.py and __init__.py) and loads
-    the first one found. Expects a predict() function in the module.
+    the first one found. Expects a predict() function in the module, and
+    calls its optional initialize() function when the miner starts.
     The default model file is my_model.py which is ready to use.
     
     Returns:
@@ -26,8 +29,12 @@ def load_student_model() -> Optional[PredictionModel]:
     
     Example:
         model = load_student_model()
-        if model:
-            prediction, interval = model.predict("2024-01-15T10:30:00+00:00")
+        if model and model.initialize():
+            try:
+                prediction, interval = model.predict("2024-01-15T10:30:00+00:00")
+            except Exception:
+                # Errors in the student's predict() propagate to the caller
+                prediction, interval = None, None
     """
     # Get the student_models directory path
     current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -39,11 +46,7 @@ def load_student_model() -> Optional[PredictionModel]:
     
     # Find Python files (excluding helpers and __init__)
     # Note: my_model.py is the default model file that students can use directly
-    excluded_files = ['__init__.py', 'helpers.py']
-    model_files = []
-    for file in os.listdir(student_models_dir):
-        if file.endswith('.py') and file not in excluded_files:
-            model_files.append(file)
+    model_files = _find_model_files(student_models_dir)
     
     if not model_files:
         bt.logging.error(
@@ -59,36 +62,23 @@ def load_student_model() -> Optional[PredictionModel]:
     bt.logging.info(f"Found student model: {model_file}")
     
     try:
-        # Load the module using importlib.util to properly handle imports
-        # Set up the module with proper package context for relative imports
-        import sys
-        
-        # Get the file path
-        file_path = os.path.join(student_models_dir, model_file)
+        # Import through the normal import system, so the module is cached in
+        # sys.modules and the model and data are only loaded once per process
+        full_name = f'miner_model.student_models.{module_name}'
+        try:
+            module = importlib.import_module(full_name)
+        except ModuleNotFoundError as e:
+            # Only fall back if the model file itself couldn't be found as part
+            # of the package (not if one of its own imports is missing)
+            if e.name != full_name:
+                raise
+            file_path = os.path.join(student_models_dir, model_file)
+            module = _load_module_from_file(full_name, file_path, student_models_dir)
         
-        # Create module spec
-        spec = importlib.util.spec_from_file_location(
-            f'miner_model.student_models.{module_name}',
-            file_path
-        )
-        
-        if spec is None or spec.loader is None:
+        if module is None:
             bt.logging.error(f"Could not create spec for {model_file}")
             return None
         
-        # Create module and set package attribute for relative imports
-        module = importlib.util.module_from_spec(spec)
-        module.__package__ = 'miner_model.student_models'
-        module.__name__ = f'miner_model.student_models.{module_name}'
-        
-        # Add parent directory to sys.path if needed for absolute imports
-        parent_dir = os.path.dirname(student_models_dir)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
-        
-        # Execute the module
-        spec.loader.exec_module(module)
-        
         # Check if predict function exists
         if not hasattr(module, 'predict'):
             bt.logging.error(
@@ -97,8 +87,8 @@ def load_student_model() -> Optional[PredictionModel]:
             )
             return None
         
-        # Wrap the predict function
-        model = FunctionBasedModel(module.predict)
+        # Wrap the predict function (and the optional initialize function)
+        model = FunctionBasedModel(module.predict, getattr(module, 'initialize', None))
         bt.logging.success(f"Successfully loaded model from {model_file}")
         
         return model
@@ -110,6 +100,43 @@ def load_student_model() -> Optional[PredictionModel]:
         return None
 
 
+def _load_module_from_file(full_name: str, file_path: str, student_models_dir: str):
+    """
+    Execute a student model file as a module of miner_model.student_models.
+    
+    Fallback for when the file can't be imported as a package member.
+    The module is registered in sys.modules so later lookups reuse it.
+    
+    Returns:
+        The executed module, or None if no spec could be created
+    """
+    # Create module spec
+    spec = importlib.util.spec_from_file_location(full_name, file_path)
+    
+    if spec is None or spec.loader is None:
+        return None
+    
+    # Create module and set package attribute for relative imports
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = 'miner_model.student_models'
+    module.__name__ = full_name
+    
+    # Add parent directory to sys.path if needed for absolute imports
+    parent_dir = os.path.dirname(student_models_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    
+    # Execute the module
+    sys.modules[full_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[full_name]
+        raise
+    
+    return module
+
+
 def list_available_models() -> list:
     """
     List all available student models.
@@ -123,11 +150,27 @@ def list_available_models() -> list:
     if not os.path.exists(student_models_dir):
         return []
     
+    return _find_model_files(student_models_dir)
+
+
+def _find_model_files(student_models_dir: str) -> list:
+    """
+    List model file names in student_models_dir (excluding helpers.py and __init__.py).
+    
+    The result is cached in student_models/.cache and only listed again
+    when the directory changes.
+    """
+    cache_path = os.path.join(student_models_dir, '.cache')
+    models = load_cache(cache_path)
+    if isinstance(models, list):
+        return models
+    
     excluded_files = ['__init__.py', 'helpers.py']
     models = []
     for file in os.listdir(student_models_dir):
         if file.endswith('.py') and file not in excluded_files:
             models.append(file)
     
+    save_cache(cache_path, models, [student_models_dir])
     return models
 
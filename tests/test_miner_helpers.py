@@ -0,0 +1,466 @@
+import os
+import sys
+import threading
+import time
+import traceback
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from miner_model.student_models.helpers import (
+    LazyModel,
+    cache_predictions,
+    dataframe_to_arrays,
+    find_files,
+    get_recent_prices,
+    get_recent_window,
+    load_keras_model,
+    load_quantized_model,
+    prepare_dataframe,
+    quantize_model,
+    read_csv,
+    timestamp_to_ns,
+)
+from miner_model.utils.file_cache import load_cache, save_cache
+
+MY_DATA_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "miner_model", "my_data.csv"
+)
+
+
+def make_data(n_rows=30, tz=True):
+    """
+    Prepared DataFrame of 5-minute prices starting at 2024-01-15 10:00.
+    """
+    times = pd.date_range(
+        "2024-01-15 10:00", periods=n_rows, freq="5min", tz="UTC" if tz else None
+    )
+    df = pd.DataFrame(
+        {
+            "timestamp_utc": times.astype(str),
+            "Close": 7.0 + np.arange(n_rows) / 1000,
+        }
+    )
+    return prepare_dataframe(df)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024-01-15T10:30:00",
+        "2024-01-15T10:30:00+00:00",
+        "2024-01-15T18:30:00+08:00",
+        "2024-01-15T05:30:00-05:00",
+        "2024-01-15T10:30:00Z",
+        "2024-01-15 10:30:00.123456+00:00",
+    ],
+)
+def test_timestamp_to_ns_matches_pandas(timestamp):
+    assert timestamp_to_ns(timestamp) == pd.Timestamp(timestamp).value
+
+
+@pytest.mark.parametrize("tz", [True, False])
+def test_timestamp_to_ns_matches_index(tz):
+    data = make_data(tz=tz)
+    _, index = dataframe_to_arrays(data)
+
+    suffix = "+00:00" if tz else ""
+    assert index[0] == timestamp_to_ns("2024-01-15T10:00:00" + suffix)
+    assert index[6] == timestamp_to_ns("2024-01-15T10:30:00" + suffix)
+    if tz:
+        assert index[6] == timestamp_to_ns("2024-01-15T18:30:00+08:00")
+
+
+def test_dataframe_to_arrays_layout():
+    data = make_data()
+    values, index = dataframe_to_arrays(data)
+
+    assert values.dtype == np.float32
+    assert values.shape == (len(data), 1)
+    assert values.flags["C_CONTIGUOUS"]
+    assert index.dtype == np.int64
+    assert np.all(np.diff(index) > 0)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024-01-15T09:00:00+00:00",  # before the data starts
+        "2024-01-15T10:55:00+00:00",  # only 11 rows before
+        "2024-01-15T11:00:00+00:00",  # exactly 12 rows before
+        "2024-01-15T11:02:30+00:00",  # between two rows
+        "2024-01-15T11:30:00+00:00",  # on a row (not included)
+        "2024-01-15T19:30:00+08:00",  # non-UTC offset
+        "2024-01-15T11:30:00Z",
+        "2024-01-15T12:30:00+00:00",  # after the data ends
+        "2024-01-16T00:00:00+00:00",  # long after the data ends
+    ],
+)
+def test_get_recent_window_matches_get_recent_prices(timestamp):
+    data = make_data()
+    values, index = dataframe_to_arrays(data)
+
+    expected = get_recent_prices(data, timestamp, n_steps=12)
+    window = get_recent_window(values, index, timestamp, n_steps=12)
+
+    if expected is None:
+        assert window is None
+    else:
+        assert window.shape == (1, 12, 1)
+        np.testing.assert_allclose(window, expected, rtol=1e-6)
+
+
+def test_get_recent_window_naive_data():
+    data = make_data(tz=False)
+    values, index = dataframe_to_arrays(data)
+
+    window = get_recent_window(values, index, "2024-01-15T11:30:00", n_steps=12)
+    expected = get_recent_prices(data, "2024-01-15T11:30:00", n_steps=12)
+    np.testing.assert_allclose(window, expected, rtol=1e-6)
+
+
+def make_counting_predict(index, maxsize=256):
+    """
+    Cached predict function that records every timestamp it actually computes.
+    """
+    calls = []
+
+    @cache_predictions(index, maxsize=maxsize)
+    def predict(timestamp):
+        calls.append(timestamp)
+        return float(len(calls)), [0.0, 1.0]
+
+    return predict, calls
+
+
+def test_cache_predictions_hits_same_window():
+    _, index = dataframe_to_arrays(make_data())
+    predict, calls = make_counting_predict(index)
+
+    first = predict("2024-01-15T11:01:00+00:00")
+    # Same rows before these timestamps -> same cache entry
+    assert predict("2024-01-15T11:01:00+00:00") == first
+    assert predict("2024-01-15T11:04:59+00:00") == first
+    assert predict("2024-01-15T11:05:00+00:00") == first
+    assert predict("2024-01-15T19:03:00+08:00") == first
+    assert len(calls) == 1
+
+    # One more row before the timestamp -> new prediction
+    assert predict("2024-01-15T11:05:01+00:00") != first
+    assert len(calls) == 2
+
+
+def test_cache_predictions_returns_copies():
+    _, index = dataframe_to_arrays(make_data())
+    predict, _ = make_counting_predict(index)
+
+    _, interval = predict("2024-01-15T11:01:00+00:00")
+    interval.append(99.0)
+    assert predict("2024-01-15T11:01:00+00:00")[1] == [0.0, 1.0]
+
+
+def test_cache_predictions_evicts_least_recently_used():
+    _, index = dataframe_to_arrays(make_data())
+    predict, calls = make_counting_predict(index, maxsize=2)
+
+    predict("2024-01-15T11:01:00+00:00")  # a
+    predict("2024-01-15T11:06:00+00:00")  # b
+    predict("2024-01-15T11:01:00+00:00")  # a is now most recently used
+    predict("2024-01-15T11:11:00+00:00")  # c evicts b
+    assert len(calls) == 3
+
+    predict("2024-01-15T11:01:00+00:00")  # a still cached
+    assert len(calls) == 3
+    predict("2024-01-15T11:06:00+00:00")  # b was evicted
+    assert len(calls) == 4
+
+
+def test_cache_predictions_cache_clear():
+    _, index = dataframe_to_arrays(make_data())
+    predict, calls = make_counting_predict(index)
+
+    predict("2024-01-15T11:01:00+00:00")
+    predict.cache_clear()
+    predict("2024-01-15T11:01:00+00:00")
+    assert len(calls) == 2
+
+
+def test_cache_predictions_does_not_cache_failures():
+    _, index = dataframe_to_arrays(make_data())
+    calls = []
+
+    @cache_predictions(index)
+    def predict(timestamp):
+        calls.append(timestamp)
+        return None, None
+
+    assert predict("2024-01-15T11:01:00+00:00") == (None, None)
+    assert predict("2024-01-15T11:01:00+00:00") == (None, None)
+    assert len(calls) == 2
+
+
+def test_cache_predictions_lazy_index():
+    _, index = dataframe_to_arrays(make_data())
+    loads = []
+
+    def get_index():
+        loads.append(1)
+        return index
+
+    @cache_predictions(get_index)
+    def predict(timestamp):
+        return 7.0, [6.9, 7.1]
+
+    assert loads == []
+    assert predict("2024-01-15T11:01:00+00:00") == (7.0, [6.9, 7.1])
+    assert loads == [1]
+
+
+def make_tree(root):
+    """
+    Small miner_model-like directory tree with old modification times.
+
+    The old mtimes make sure adding a file later always changes them, even on
+    filesystems with coarse timestamps.
+    """
+    (root / "data").mkdir()
+    (root / "LSTM_outside_example").mkdir()
+    (root / "__pycache__").mkdir()
+    (root / "my_model.h5").write_bytes(b"")
+    (root / "data" / "my_data.csv").write_text("")
+    (root / "LSTM_outside_example" / "lstm_model.h5").write_bytes(b"")
+    (root / "__pycache__" / "stray.csv").write_text("")
+    for path in [root, root / "data", root / "LSTM_outside_example", root / "__pycache__"]:
+        os.utime(path, ns=(10**18, 10**18))
+
+
+def test_file_cache_roundtrip_and_invalidation(tmp_path):
+    scanned = tmp_path / "scanned"
+    scanned.mkdir()
+    os.utime(scanned, ns=(10**18, 10**18))
+    cache_path = str(tmp_path / "cache.json")
+
+    assert load_cache(cache_path) is None
+
+    save_cache(cache_path, {"files": ["a.h5"]}, [str(scanned)])
+    assert load_cache(cache_path) == {"files": ["a.h5"]}
+
+    (scanned / "b.h5").write_bytes(b"")
+    assert load_cache(cache_path) is None
+
+
+def test_file_cache_missing_directory(tmp_path):
+    scanned = tmp_path / "scanned"
+    scanned.mkdir()
+    cache_path = str(tmp_path / "cache.json")
+
+    save_cache(cache_path, ["a.h5"], [str(scanned)])
+    scanned.rmdir()
+    assert load_cache(cache_path) is None
+
+
+def test_file_cache_corrupt_file(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("{not json")
+    assert load_cache(str(cache_path)) is None
+
+
+def test_file_cache_inside_scanned_directory(tmp_path):
+    # Creating the cache file changes its directory's mtime - that must not
+    # invalidate the cache it was just saved in
+    cache_path = str(tmp_path / "cache.json")
+    save_cache(cache_path, ["a.h5"], [str(tmp_path)])
+    assert load_cache(cache_path) == ["a.h5"]
+
+
+def test_find_files_single_walk_and_pruning(tmp_path):
+    make_tree(tmp_path)
+
+    found = find_files(str(tmp_path), [".h5", ".csv"], exclude_dirs=["LSTM_outside_example"])
+
+    assert found == {
+        ".h5": [str(tmp_path / "my_model.h5")],
+        ".csv": [str(tmp_path / "data" / "my_data.csv")],
+    }
+
+
+def test_find_files_cache_invalidated_when_file_added(tmp_path):
+    root = tmp_path / "miner_model"
+    root.mkdir()
+    make_tree(root)
+    cache_path = str(tmp_path / "_discovery_cache.json")
+
+    found = find_files(str(root), [".h5", ".csv"], exclude_dirs=["LSTM_outside_example"], cache_path=cache_path)
+    assert found[".csv"] == [str(root / "data" / "my_data.csv")]
+
+    # Reused from the cache: the file removed behind its back is still listed
+    os.remove(root / "data" / "my_data.csv")
+    os.utime(root / "data", ns=(10**18, 10**18))
+    cached = find_files(str(root), [".h5", ".csv"], exclude_dirs=["LSTM_outside_example"], cache_path=cache_path)
+    assert cached == found
+
+    # Adding a file in a scanned subdirectory changes its mtime -> scanned again
+    (root / "data" / "more_data.csv").write_text("")
+    found = find_files(str(root), [".h5", ".csv"], exclude_dirs=["LSTM_outside_example"], cache_path=cache_path)
+    assert found[".csv"] == [str(root / "data" / "more_data.csv")]
+
+    # Files in excluded directories never invalidate the cache
+    (root / "LSTM_outside_example" / "other.csv").write_text("")
+    assert find_files(str(root), [".h5", ".csv"], exclude_dirs=["LSTM_outside_example"], cache_path=cache_path) == found
+
+
+class FakeKerasModel:
+    def __init__(self, architecture):
+        self.architecture = architecture
+        self.weights_from = None
+
+    def to_json(self):
+        return self.architecture
+
+    def load_weights(self, path):
+        self.weights_from = path
+
+
+def test_load_keras_model_caches_architecture(tmp_path, monkeypatch):
+    full_loads = []
+
+    def load_model(path, compile=True, custom_objects=None):
+        full_loads.append(path)
+        return FakeKerasModel('{"layers": %d}' % len(full_loads))
+
+    def model_from_json(architecture, custom_objects=None):
+        return FakeKerasModel(architecture)
+
+    keras_models = types.SimpleNamespace(load_model=load_model, model_from_json=model_from_json)
+    monkeypatch.setitem(sys.modules, "tensorflow", types.SimpleNamespace())
+    monkeypatch.setitem(sys.modules, "tensorflow.keras", types.SimpleNamespace(models=keras_models))
+    monkeypatch.setitem(sys.modules, "tensorflow.keras.models", keras_models)
+    model_path = tmp_path / "my_model.h5"
+    model_path.write_bytes(b"weights")
+    cache_path = str(tmp_path / "_arch_cache.json")
+
+    load_keras_model(str(model_path), cache_path=cache_path)
+    cached = load_keras_model(str(model_path), cache_path=cache_path)
+    assert full_loads == [str(model_path)]
+    assert cached.architecture == '{"layers": 1}'
+    assert cached.weights_from == str(model_path)
+
+    # A retrained model is loaded in full again
+    model_path.write_bytes(b"new weights")
+    assert load_keras_model(str(model_path), cache_path=cache_path).architecture == '{"layers": 2}'
+    assert len(full_loads) == 2
+
+
+class FailingConverter:
+    """Stands in for tf.lite.TFLiteConverter on a model it can't convert."""
+
+    calls = 0
+
+    @classmethod
+    def from_keras_model(cls, model):
+        cls.calls += 1
+        raise ValueError("unsupported layer")
+
+
+def test_quantize_model_remembers_failed_conversion(tmp_path, monkeypatch):
+    fake_tf = types.SimpleNamespace(lite=types.SimpleNamespace(TFLiteConverter=FailingConverter))
+    monkeypatch.setitem(sys.modules, "tensorflow", fake_tf)
+    monkeypatch.setattr(FailingConverter, "calls", 0)
+    model_path = tmp_path / "my_model.h5"
+    model_path.write_bytes(b"weights")
+    sample = np.zeros((1, 12, 1), dtype=np.float32)
+
+    assert quantize_model(object(), str(model_path), sample) is None
+    assert FailingConverter.calls == 1
+    assert load_quantized_model(str(model_path)) is None
+
+    # Not converted again for the same .h5 file...
+    assert quantize_model(object(), str(model_path), sample) is None
+    assert FailingConverter.calls == 1
+
+    # ...but a retrained model is
+    model_path.write_bytes(b"new weights")
+    assert quantize_model(object(), str(model_path), sample) is None
+    assert FailingConverter.calls == 2
+
+
+def test_lazy_model_loads_once():
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return "model"
+
+    loaded = LazyModel(load)
+    assert calls == []
+
+    threads = [threading.Thread(target=loaded.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loaded.get() == "model"
+    assert calls == [1]
+
+
+def test_lazy_model_remembers_failure():
+    calls = []
+
+    def load():
+        calls.append(1)
+        raise OSError("file is being copied")
+
+    loaded = LazyModel(load, retry_after=3600)
+
+    with pytest.raises(OSError):
+        loaded.get()
+
+    errors = []
+    for _ in range(3):
+        with pytest.raises(RuntimeError) as exc_info:
+            loaded.get()
+        errors.append(exc_info.value)
+
+    # Not loaded again, and each call raises a new exception caused by the
+    # original one, whose traceback doesn't grow
+    assert calls == [1]
+    assert len({id(e) for e in errors}) == 3
+    assert all(isinstance(e.__cause__, OSError) for e in errors)
+    frames = len(traceback.extract_tb(errors[0].__cause__.__traceback__))
+    assert len(traceback.extract_tb(errors[-1].__cause__.__traceback__)) == frames
+
+
+def test_lazy_model_retries_after_backoff():
+    results = [OSError("file is being copied"), "model"]
+
+    def load():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    loaded = LazyModel(load, retry_after=0)
+
+    with pytest.raises(OSError):
+        loaded.get()
+    assert loaded.get() == "model"
+    assert loaded.get() == "model"
+
+
+def test_read_csv_pyarrow_matches_pandas(monkeypatch):
+    pytest.importorskip("pyarrow.csv")
+    arrow_values, arrow_index = dataframe_to_arrays(prepare_dataframe(read_csv(MY_DATA_CSV)))
+
+    # Make "import pyarrow.csv" fail, so read_csv falls back to pandas
+    monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+    pandas_values, pandas_index = dataframe_to_arrays(prepare_dataframe(read_csv(MY_DATA_CSV)))
+
+    # The two parsers give different datetime units - the arrays must not differ
+    np.testing.assert_array_equal(arrow_values, pandas_values)
+    np.testing.assert_array_equal(arrow_index, pandas_index)
+    assert arrow_values.dtype == pandas_values.dtype == np.float32
+    assert arrow_index.dtype == pandas_index.dtype == np.int64
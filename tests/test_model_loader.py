@@ -0,0 +1,134 @@
+import sys
+import types
+
+import pytest
+
+from miner_model.student_models import my_model
+from miner_model.student_models.helpers import LazyModel
+from miner_model.utils import model_loader
+from miner_model.utils.function_wrapper import FunctionBasedModel
+
+FULL_NAME = "miner_model.student_models.my_model"
+
+
+def failing_load():
+    raise OSError("my_model.h5 is corrupt")
+
+
+def test_initialize_returns_false_when_loading_fails(monkeypatch):
+    monkeypatch.setattr(my_model, "loaded", LazyModel(failing_load))
+    model = FunctionBasedModel(my_model.predict, my_model.initialize)
+
+    assert model.initialize() is False
+    with pytest.raises(RuntimeError) as exc_info:
+        model.predict("2025-10-13T16:30:00+00:00")
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+
+def test_initialize_loads_once(monkeypatch):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "fast_model", "data", "values", "index"
+
+    monkeypatch.setattr(my_model, "loaded", LazyModel(load))
+
+    assert my_model.initialize() is True
+    assert my_model.initialize() is True
+    assert my_model.loaded.get()[0] == "fast_model"
+    assert calls == [1]
+
+
+def fake_student_module():
+    module = types.ModuleType(FULL_NAME)
+    module.predict = lambda timestamp: (100.0, [99.0, 101.0])
+    return module
+
+
+@pytest.fixture
+def only_my_model(monkeypatch):
+    monkeypatch.setattr(model_loader, "_find_model_files", lambda student_models_dir: ["my_model.py"])
+
+
+def test_load_student_model_uses_import_system(monkeypatch, only_my_model):
+    imported = []
+    module = fake_student_module()
+
+    def import_module(name):
+        imported.append(name)
+        return module
+
+    def load_from_file(*args):
+        raise AssertionError("file fallback should not be used")
+
+    monkeypatch.setattr(model_loader.importlib, "import_module", import_module)
+    monkeypatch.setattr(model_loader, "_load_module_from_file", load_from_file)
+
+    model = model_loader.load_student_model()
+
+    assert imported == [FULL_NAME]
+    assert model.predict("2025-10-13T16:30:00+00:00") == (100.0, [99.0, 101.0])
+
+
+def test_load_student_model_falls_back_to_file(monkeypatch, only_my_model):
+    loaded_from = []
+    module = fake_student_module()
+
+    def import_module(name):
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    def load_from_file(full_name, file_path, student_models_dir):
+        loaded_from.append((full_name, file_path))
+        return module
+
+    monkeypatch.setattr(model_loader.importlib, "import_module", import_module)
+    monkeypatch.setattr(model_loader, "_load_module_from_file", load_from_file)
+
+    model = model_loader.load_student_model()
+
+    assert model is not None
+    assert loaded_from[0][0] == FULL_NAME
+    assert loaded_from[0][1].endswith("my_model.py")
+
+
+def test_load_student_model_missing_dependency_is_not_retried(monkeypatch, only_my_model):
+    # A missing package imported by the model file must be reported, not
+    # hidden by loading the file a second time
+    def import_module(name):
+        raise ModuleNotFoundError("No module named 'xgboost'", name="xgboost")
+
+    def load_from_file(*args):
+        raise AssertionError("file fallback should not be used")
+
+    monkeypatch.setattr(model_loader.importlib, "import_module", import_module)
+    monkeypatch.setattr(model_loader, "_load_module_from_file", load_from_file)
+
+    assert model_loader.load_student_model() is None
+
+
+def test_load_module_from_file_registers_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    name = "miner_model.student_models.file_model"
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    path = tmp_path / "file_model.py"
+    path.write_text("def predict(timestamp):\n    return 1.0, [0.0, 2.0]\n")
+
+    module = model_loader._load_module_from_file(name, str(path), str(tmp_path))
+
+    assert sys.modules[name] is module
+    assert module.__package__ == "miner_model.student_models"
+    assert module.predict("2025-10-13T16:30:00+00:00") == (1.0, [0.0, 2.0])
+
+
+def test_load_module_from_file_cleans_up_on_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    name = "miner_model.student_models.broken_model"
+    path = tmp_path / "broken_model.py"
+    path.write_text("raise ValueError('bad model file')\n")
+
+    with pytest.raises(ValueError):
+        model_loader._load_module_from_file(name, str(path), str(tmp_path))
+
+    # A half-executed module must not be reused by later imports
+    assert name not in sys.modules